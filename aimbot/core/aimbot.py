@@ -9,27 +9,73 @@ This system integrates:
 """
 
 import os
+import atexit
 import configparser
 import logging
+import logging.handlers
+import queue
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 
 from nlp.sentiment_model import SentimentAnalyzer
-from signals.signal_generator import SignalGenerator
+from signals.signal_generator import Action, SignalGenerator
 from trading.trade_executor import TradeExecutor
-from utils.market_data import get_market_data
+from utils.market_data import get_market_data_batch
 
-# Set up logging
+# Set up logging. Records are queued from the calling thread and written to the
+# file and console by a background listener so trading calls never block on I/O.
+_log_queue = queue.Queue(-1)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+
+# The listener's handlers apply the full format, so the queued message is left bare
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('aimbot.log'),
-        logging.StreamHandler()
-    ]
+    format='%(message)s',
+    handlers=[_queue_handler]
 )
 
+# basicConfig is a no-op when the root logger is already configured (notebooks,
+# embedding apps); only open the log file and start the listener if ours was attached
+if _queue_handler in logging.getLogger().handlers:
+    _log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    _file_handler = logging.FileHandler('aimbot.log')
+    _file_handler.setFormatter(_log_formatter)
+    _stream_handler = logging.StreamHandler()
+    _stream_handler.setFormatter(_log_formatter)
+
+    _log_listener = logging.handlers.QueueListener(_log_queue, _file_handler, _stream_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
 logger = logging.getLogger('aimbot')
 
+def _option(section, key, default):
+    """Dataclass field read from `key` in `section` of the config file."""
+    return field(default=default, metadata={'section': section, 'key': key})
+
+@dataclass(slots=True, frozen=True)
+class Config:
+    """Typed settings read once from the config file."""
+    sentiment_model: str = _option('sentiment', 'model', 'vader')
+    sentiment_batch_size: int = _option('sentiment', 'batch_size', 32)
+    signal_strategy: str = _option('signals', 'strategy', 'rule_based')
+    min_confidence: float = _option('signals', 'min_confidence', 0.2)  # News with weaker sentiment cannot produce a trade
+    buy_threshold: float = _option('signals', 'buy_threshold', 0.3)
+    sell_threshold: float = _option('signals', 'sell_threshold', -0.3)
+    broker: str = _option('execution', 'broker', 'paper')
+    api_key: str | None = _option('execution', 'api_key', None)
+    api_secret: str | None = _option('execution', 'api_secret', None)
+
+    @classmethod
+    def from_parser(cls, parser):
+        """Build settings from a ConfigParser, using the field defaults for missing keys."""
+        getters = {int: parser.getint, float: parser.getfloat}
+        values = {}
+        for f in fields(cls):
+            getter = getters.get(type(f.default), parser.get)
+            values[f.name] = getter(f.metadata['section'], f.metadata['key'], fallback=f.default)
+        return cls(**values)
+
 class AimBot:
     """
     Main class that integrates all components of the trading system.
@@ -37,21 +83,24 @@ class AimBot:
 
     def __init__(self, config_path="config.ini"):
         """Initialize the AimBot system with configuration."""
-        self.config = self._load_config(config_path)
+        self.config = Config.from_parser(self._load_config(config_path))
 
         # Initialize components
         self.sentiment_analyzer = SentimentAnalyzer(
-            model_name=self.config.get('sentiment', 'model', fallback='vader')
+            model_name=self.config.sentiment_model,
+            batch_size=self.config.sentiment_batch_size
         )
 
         self.signal_generator = SignalGenerator(
-            strategy=self.config.get('signals', 'strategy', fallback='rule_based')
+            strategy=self.config.signal_strategy,
+            buy_threshold=self.config.buy_threshold,
+            sell_threshold=self.config.sell_threshold
         )
 
         self.trade_executor = TradeExecutor(
-            broker=self.config.get('execution', 'broker', fallback='paper'),
-            api_key=self.config.get('execution', 'api_key', fallback=None),
-            api_secret=self.config.get('execution', 'api_secret', fallback=None)
+            broker=self.config.broker,
+            api_key=self.config.api_key,
+            api_secret=self.config.api_secret
         )
 
         logger.info("AimBot system initialized")
@@ -70,15 +119,18 @@ class AimBot:
         """Process a single news item through the pipeline."""
         # 1. Analyze sentiment
         sentiment_result = self.sentiment_analyzer.analyze_text(news_item['text'])
+        if sentiment_result['confidence'] < self.config.min_confidence:
+            return {"sentiment": sentiment_result, "entities": [], "signals": [], "trades": []}
 
         # 2. Extract relevant entities (tickers)
         entities = self.sentiment_analyzer.extract_entities(news_item['text'])
 
-        # 3. Generate signals for each relevant entity
+        # 3. Generate one signal per unique ticker, fetching market data once for all of them
+        unique_tickers = list(dict.fromkeys(entity['ticker'] for entity in entities))
+        market_data_map = get_market_data_batch(unique_tickers)
         signals = []
-        for entity in entities:
-            ticker = entity['ticker']
-            market_data = get_market_data(ticker)
+        for ticker in unique_tickers:
+            market_data = market_data_map[ticker]
 
             signal = self.signal_generator.generate_signal(
                 ticker, sentiment_result, market_data
@@ -86,19 +138,63 @@ class AimBot:
             signals.append(signal)
 
         # 4. Execute trades based on signals
-        trade_results = []
-        for signal in signals:
-            if signal['action'] in ['BUY', 'SELL']:
-                trade_result = self.trade_executor.execute_trade(signal)
-                trade_results.append(trade_result)
+        trade_results = self._execute_signals(signals)
 
         return {
             "sentiment": sentiment_result,
             "entities": entities,
-            "signals": signals,
+            "signals": self._signals_for_output(signals),
             "trades": trade_results
         }
 
+    def process_news_batch(self, news_items):
+        """Process several news items, batching sentiment inference and market data lookups."""
+        texts = [item['text'] for item in news_items]
+
+        # 1. Analyze sentiment for the whole batch at once
+        sentiment_results = self.sentiment_analyzer.analyze_texts(texts)
+
+        # 2. Extract entities per item and fetch market data once for all tickers,
+        #    skipping items whose sentiment is too weak to trade on
+        entities_per_item = [
+            self.sentiment_analyzer.extract_entities(text)
+            if sentiment_result['confidence'] >= self.config.min_confidence else []
+            for text, sentiment_result in zip(texts, sentiment_results)
+        ]
+        market_data_map = get_market_data_batch(
+            entity['ticker'] for entities in entities_per_item for entity in entities
+        )
+
+        # 3. Fan signals and trades back out per item
+        results = []
+        for sentiment_result, entities in zip(sentiment_results, entities_per_item):
+            signals = [
+                self.signal_generator.generate_signal(
+                    ticker, sentiment_result, market_data_map[ticker]
+                )
+                for ticker in dict.fromkeys(entity['ticker'] for entity in entities)
+            ]
+            results.append({
+                "sentiment": sentiment_result,
+                "entities": entities,
+                "signals": self._signals_for_output(signals),
+                "trades": self._execute_signals(signals)
+            })
+
+        return results
+
+    def _signals_for_output(self, signals):
+        """Report signal actions by name, matching the trade results."""
+        return [{**signal, "action": signal['action'].name} for signal in signals]
+
+    def _execute_signals(self, signals):
+        """Execute trades for all actionable signals."""
+        return [
+            self.trade_executor.execute_trade(signal)
+            for signal in signals
+            if signal['action'] != Action.HOLD
+        ]
+
     def run(self, mode="paper"):
         """Run the trading system in the specified mode."""
         logger.info(f"Starting AimBot in {mode} mode")
@@ -1,21 +1,71 @@
 # nlp/sentiment_model.py
+import functools
 import logging
 import re
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
 logger = logging.getLogger('aimbot')
 
+_TICKER_RE = re.compile(r'\$([A-Z]{1,5})')
+_STAR_LABEL_RE = re.compile(r'([1-5]) STARS?')
+
 class SentimentAnalyzer:
-    def __init__(self, model_name="vader"):
+    def __init__(self, model_name="vader", cache_size=4096, batch_size=32):
         self.model_name = model_name
+        self.batch_size = batch_size
+        self.pipeline = None
+        self._warned_labels = set()
         logger.info(f"Initializing Sentiment Analyzer with {model_name}")
+
+        if model_name != "vader":
+            try:
+                from transformers import pipeline
+                self.pipeline = pipeline("sentiment-analysis", model=model_name)
+            except ImportError:
+                logger.error("transformers not installed, falling back to vader. Run: pip install transformers")
+            except Exception as e:
+                logger.error(f"Failed to load sentiment model {model_name}, falling back to vader: {e}")
+
         self.model = SentimentIntensityAnalyzer()
+        # Duplicate headlines (retweets, cross-posts) reuse the previous score
+        self._polarity_scores = functools.lru_cache(maxsize=cache_size)(self.model.polarity_scores)
 
     def analyze_text(self, text):
-        scores = self.model.polarity_scores(text)
-        compound = scores['compound']
-        return {"score": compound, "confidence": abs(compound)}
+        return self.analyze_texts([text])[0]
+
+    def analyze_texts(self, texts):
+        """Score a list of texts, batching the forward pass for transformer models."""
+        if self.pipeline is not None:
+            # Long articles are cut to the model's max sequence length instead of failing the batch
+            outputs = self.pipeline(list(texts), batch_size=self.batch_size, truncation=True)
+            return [self._from_label(o) for o in outputs]
+
+        results = []
+        for text in texts:
+            compound = self._polarity_scores(text)['compound']
+            results.append({"score": compound, "confidence": abs(compound)})
+        return results
+
+    def _from_label(self, output):
+        """Map a classifier label/score pair onto the signed compound scale."""
+        label = output['label'].upper()
+        if label.startswith("NEG"):
+            score = -output['score']
+        elif label.startswith("POS"):
+            score = output['score']
+        elif label.startswith("NEU"):
+            score = 0.0
+        elif (match := _STAR_LABEL_RE.fullmatch(label)):
+            # Star ratings: 1 star is fully negative, 3 neutral, 5 fully positive
+            score = (int(match.group(1)) - 3) / 2 * output['score']
+        else:
+            if label not in self._warned_labels:
+                self._warned_labels.add(label)
+                logger.warning(
+                    f"Unrecognized sentiment label {output['label']} from {self.model_name}, scoring as neutral"
+                )
+            score = 0.0
+        return {"score": score, "confidence": abs(score)}
 
     def extract_entities(self, text):
-        tickers = re.findall(r'\$[A-Z]{1,5}', text)
-        return [{"ticker": t[1:]} for t in tickers]
+        return [{"ticker": m.group(1)} for m in _TICKER_RE.finditer(text)]
@@ -0,0 +1,77 @@
+# signals/signal_generator.py
+import logging
+import numbers
+from enum import IntEnum
+
+logger = logging.getLogger('aimbot')
+
+class Action(IntEnum):
+    """Trade actions carried in signal['action']."""
+    HOLD = 0
+    BUY = 1
+    SELL = 2
+
+    @classmethod
+    def from_value(cls, value):
+        """
+        Map an action name ('BUY') or integer code to an Action, defaulting to HOLD.
+        Floats, bools and other types map to HOLD so they can never place an order.
+        """
+        if isinstance(value, str):
+            return cls.__members__.get(value, cls.HOLD)
+        if isinstance(value, numbers.Integral) and not isinstance(value, bool):
+            try:
+                return cls(int(value))
+            except ValueError:
+                return cls.HOLD
+        return cls.HOLD
+
+def _compile_rule_based(buy_threshold, sell_threshold):
+    """
+    Build a rule-based signal function: trade in the direction of strong sentiment
+    when the price trend (price vs MA20) agrees, otherwise hold. A NaN MA20 (too
+    little history) fails both comparisons and holds.
+    """
+    def generate_signal(ticker, sentiment, market_data):
+        score = sentiment['score']
+        price = market_data.get('price')
+        ma20 = market_data.get('ma20')
+
+        action = Action.HOLD
+        if price is not None and ma20 is not None:
+            if score >= buy_threshold and price >= ma20:
+                action = Action.BUY
+            elif score <= sell_threshold and price <= ma20:
+                action = Action.SELL
+
+        return {"ticker": ticker, "action": action, "confidence": sentiment['confidence']}
+
+    return generate_signal
+
+_STRATEGIES = {
+    "rule_based": _compile_rule_based,
+}
+
+class SignalGenerator:
+    """Generates trading signals from sentiment and market data."""
+
+    def __init__(self, strategy="rule_based", buy_threshold=0.3, sell_threshold=-0.3):
+        """
+        Initialize the signal generator for the given strategy.
+
+        Args:
+            strategy (str): Strategy name ('rule_based')
+            buy_threshold (float): Minimum sentiment score for a BUY
+            sell_threshold (float): Maximum sentiment score for a SELL
+        """
+        if strategy not in _STRATEGIES:
+            logger.warning(f"Strategy {strategy} not supported, using rule_based")
+            strategy = "rule_based"
+
+        self.strategy = strategy
+        self.buy_threshold = buy_threshold
+        self.sell_threshold = sell_threshold
+        logger.info(f"Initializing Signal Generator with {strategy} strategy")
+
+        # Specialize once so each call runs the strategy directly, with no dispatch or attribute lookups
+        self.generate_signal = _STRATEGIES[strategy](buy_threshold, sell_threshold)
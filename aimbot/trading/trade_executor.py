@@ -1,4 +1,11 @@
+# trading/trade_executor.py
+import logging
+import time
+from datetime import datetime
 
+from signals.signal_generator import Action
+
+logger = logging.getLogger('aimbot')
 
 class TradeExecutor:
     """Executes trades based on generated signals."""
@@ -26,6 +33,7 @@ class TradeExecutor:
         
         logger.info(f"Initializing Trade Executor with {broker} broker")
         self._connect_to_broker()
+        self._bind_broker_methods()
     
     def _connect_to_broker(self):
         """Establish connection to the broker API."""
@@ -38,6 +46,8 @@ class TradeExecutor:
                 try:
                     # Import Alpaca SDK
                     import alpaca_trade_api as tradeapi
+                    from requests.adapters import HTTPAdapter
+                    from urllib3.util.retry import Retry
                     
                     # Connect to Alpaca API
                     self.client = tradeapi.REST(
@@ -46,6 +56,14 @@ class TradeExecutor:
                         base_url='https://paper-api.alpaca.markets' # Use paper trading endpoint by default
                     )
                     
+                    # Reuse keep-alive connections across calls instead of a new handshake per request
+                    adapter = HTTPAdapter(
+                        pool_connections=16,
+                        pool_maxsize=16,
+                        max_retries=Retry(total=3, backoff_factor=0.1)
+                    )
+                    self.client._session.mount('https://', adapter)
+                    
                     # Test connection
                     account = self.client.get_account()
                     logger.info(f"Connected to Alpaca. Account status: {account.status}")
@@ -62,6 +80,18 @@ class TradeExecutor:
         except Exception as e:
             logger.error(f"Error connecting to broker: {str(e)}")
     
+    def _bind_broker_methods(self):
+        """Resolve the broker-specific implementations once instead of branching on every call."""
+        if self.broker == "paper":
+            self._execute_impl = self._execute_paper
+            self._check_order_status_impl = self._check_order_status_paper
+        elif self.broker == "alpaca" and self.client:
+            self._execute_impl = self._execute_alpaca
+            self._check_order_status_impl = self._check_order_status_alpaca
+        else:
+            self._execute_impl = self._execute_unavailable
+            self._check_order_status_impl = self._check_order_status_unknown
+    
     def execute_trade(self, signal, order_type="market", limit_price=None, quantity=None):
         """
         Execute a trade based on the given signal.
@@ -79,89 +109,96 @@ class TradeExecutor:
         action = signal['action']
         confidence = signal['confidence']
         
-        if action not in ["BUY", "SELL"]:
-            logger.info(f"No trade to execute for {ticker} (action: {action})")
+        # SignalGenerator emits Action members; names or codes from other callers are converted here
+        if type(action) is not Action:
+            action = Action.from_value(action)
+        
+        if action == Action.HOLD:
+            logger.info(f"No trade to execute for {ticker} (action: {action.name})")
             return {"status": "no_trade", "order_id": None}
         
         # Log the execution
-        logger.info(f"Executing {action} for {ticker} with {confidence} confidence")
+        logger.info(f"Executing {action.name} for {ticker} with {confidence} confidence")
         
         try:
-            # Paper trading mode
-            if self.broker == "paper":
-                logger.info(f"Paper trading: {action} {ticker}")
-                return {
-                    "status": "success", 
-                    "order_id": f"paper-{datetime.now().timestamp()}",
-                    "ticker": ticker,
-                    "action": action,
-                    "quantity": quantity or 10,  # Default for paper trading
-                    "price": None,  # Would be filled in real execution
-                    "timestamp": datetime.now().isoformat()
-                }
-            
-            # Calculate position size if not provided
-            if quantity is None:
-                quantity = self._calculate_position_size(ticker, confidence)
-                
-            # Execute with Alpaca
-            if self.broker == "alpaca" and self.client:
-                side = "buy" if action == "BUY" else "sell"
-                
-                if order_type == "market":
-                    # Market order
-                    order = self.client.submit_order(
-                        symbol=ticker,
-                        qty=quantity,
-                        side=side,
-                        type='market',
-                        time_in_force='gtc'
-                    )
-                    
-                elif order_type == "limit" and limit_price:
-                    # Limit order
-                    order = self.client.submit_order(
-                        symbol=ticker,
-                        qty=quantity,
-                        side=side,
-                        type='limit',
-                        time_in_force='gtc',
-                        limit_price=limit_price
-                    )
-                
-                # Add stop loss if enabled
-                if self.use_stop_loss and action == "BUY":
-                    current_price = float(self.client.get_latest_trade(ticker).price)
-                    stop_price = current_price * (1 - self.stop_loss_pct)
-                    
-                    self.client.submit_order(
-                        symbol=ticker,
-                        qty=quantity,
-                        side="sell",
-                        type='stop',
-                        time_in_force='gtc',
-                        stop_price=stop_price
-                    )
-                    logger.info(f"Set stop loss for {ticker} at {stop_price}")
-                
-                return {
-                    "status": "success",
-                    "order_id": order.id,
-                    "ticker": ticker,
-                    "action": action,
-                    "quantity": quantity,
-                    "price": limit_price if order_type == "limit" else None,
-                    "timestamp": datetime.now().isoformat()
-                }
-                
-            else:
-                logger.error(f"Cannot execute trade: broker {self.broker} not connected")
-                return {"status": "error", "order_id": None, "message": "Broker not connected"}
+            return self._execute_impl(ticker, action, confidence, order_type, limit_price, quantity)
                 
         except Exception as e:
             logger.error(f"Error executing trade for {ticker}: {str(e)}")
             return {"status": "error", "order_id": None, "message": str(e)}
     
+    def _execute_paper(self, ticker, action, confidence, order_type, limit_price, quantity):
+        """Simulate a trade without contacting a broker."""
+        logger.info(f"Paper trading: {action.name} {ticker}")
+        return {
+            "status": "success", 
+            "order_id": f"paper-{time.time_ns()}",
+            "ticker": ticker,
+            "action": action.name,
+            "quantity": quantity or 10,  # Default for paper trading
+            "price": None,  # Would be filled in real execution
+            "timestamp": datetime.now().isoformat()
+        }
+    
+    def _execute_alpaca(self, ticker, action, confidence, order_type, limit_price, quantity):
+        """Submit a trade to Alpaca."""
+        # Calculate position size if not provided
+        if quantity is None:
+            quantity = self._calculate_position_size(ticker, confidence)
+            
+        side = "buy" if action == Action.BUY else "sell"
+        
+        # Attach the stop loss to the parent order so the broker submits both legs at once
+        stop_loss_kwargs = {}
+        if self.use_stop_loss and action == Action.BUY:
+            if order_type == "limit" and limit_price:
+                reference_price = limit_price
+            else:
+                reference_price = float(self.client.get_latest_trade(ticker).price)
+            stop_price = round(reference_price * (1 - self.stop_loss_pct), 2)
+            stop_loss_kwargs = {"order_class": "oto", "stop_loss": {"stop_price": stop_price}}
+        
+        if order_type == "market":
+            # Market order
+            order = self.client.submit_order(
+                symbol=ticker,
+                qty=quantity,
+                side=side,
+                type='market',
+                time_in_force='gtc',
+                **stop_loss_kwargs
+            )
+            
+        elif order_type == "limit" and limit_price:
+            # Limit order
+            order = self.client.submit_order(
+                symbol=ticker,
+                qty=quantity,
+                side=side,
+                type='limit',
+                time_in_force='gtc',
+                limit_price=limit_price,
+                **stop_loss_kwargs
+            )
+        
+        if stop_loss_kwargs:
+            logger.info(f"Set stop loss for {ticker} at {stop_price}")
+        
+        return {
+            "status": "success",
+            "order_id": order.id,
+            "ticker": ticker,
+            "action": action.name,
+            "quantity": quantity,
+            "price": limit_price if order_type == "limit" else None,
+            "timestamp": datetime.now().isoformat()
+        }
+    
+    def _execute_unavailable(self, ticker, action, confidence, order_type, limit_price, quantity):
+        """Reject trades when no broker is connected."""
+        logger.error(f"Cannot execute trade: broker {self.broker} not connected")
+        return {"status": "error", "order_id": None, "message": "Broker not connected"}
+    
     def _calculate_position_size(self, ticker, confidence):
         """Calculate the position size based on risk parameters and confidence."""
         # Simple position sizing based on confidence and max capital
@@ -178,21 +215,24 @@ class TradeExecutor:
         Returns:
             dict: Order status information
         """
-        if self.broker == "paper":
-            # For paper trading, simulate a filled order
-            return {"status": "filled", "filled_qty": 10, "filled_price": 100.0}
-            
-        elif self.broker == "alpaca" and self.client:
-            try:
-                order = self.client.get_order(order_id)
-                return {
-                    "status": order.status,
-                    "filled_qty": order.filled_qty,
-                    "filled_price": order.filled_avg_price,
-                    "symbol": order.symbol
-                }
-            except Exception as e:
-                logger.error(f"Error checking order status: {str(e)}")
-                return {"status": "error", "message": str(e)}
-        
-        return {"status": "unknown"}
\ No newline at end of file
+        return self._check_order_status_impl(order_id)
+    
+    def _check_order_status_paper(self, order_id):
+        # For paper trading, simulate a filled order
+        return {"status": "filled", "filled_qty": 10, "filled_price": 100.0}
+    
+    def _check_order_status_alpaca(self, order_id):
+        try:
+            order = self.client.get_order(order_id)
+            return {
+                "status": order.status,
+                "filled_qty": order.filled_qty,
+                "filled_price": order.filled_avg_price,
+                "symbol": order.symbol
+            }
+        except Exception as e:
+            logger.error(f"Error checking order status: {str(e)}")
+            return {"status": "error", "message": str(e)}
+    
+    def _check_order_status_unknown(self, order_id):
+        return {"status": "unknown"}
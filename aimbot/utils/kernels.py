@@ -0,0 +1,48 @@
+# utils/kernels.py
+"""
+Numeric kernels over raw float64 arrays, JIT-compiled with numba when available.
+Each kernel accumulates in the loop and divides once at the end so numba can
+vectorize the reduction.
+"""
+import functools
+import math
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+def _mean(x):
+    """Mean of x, NaN if empty."""
+    if x.size == 0:
+        return math.nan
+    s = 0.0
+    for i in range(x.size):
+        s += x[i]
+    return s / x.size
+
+def _rolling_mean_last(x, window):
+    """Mean of the last `window` values of x, NaN if x has fewer than `window` values or window < 1."""
+    if window < 1 or x.size < window:
+        return math.nan
+    s = 0.0
+    for i in range(x.size - window, x.size):
+        s += x[i]
+    return s / window
+
+if njit is not None:
+    # Explicit signatures compile at import rather than on the first call in the trade path.
+    # 'reassoc' is enough to vectorize the sums without assuming inputs are NaN-free.
+    mean = njit("float64(float64[:])", cache=True, fastmath={'reassoc'})(_mean)
+    rolling_mean_last = njit("float64(float64[:], int64)", cache=True, fastmath={'reassoc'})(_rolling_mean_last)
+else:
+    # NumPy reductions are faster than the pure-Python loops when numba is unavailable
+    @functools.wraps(_mean)
+    def mean(x):
+        return float(x.mean()) if x.size else math.nan
+
+    @functools.wraps(_rolling_mean_last)
+    def rolling_mean_last(x, window):
+        if window < 1 or x.size < window:
+            return math.nan
+        return float(x[x.size - window:].mean())
@@ -1,29 +1,124 @@
 import yfinance as yf
 import logging
 
+from utils.kernels import mean, rolling_mean_last
+
 logger = logging.getLogger('aimbot')
 
+try:
+    from diskcache import Cache
+    _MD_CACHE = Cache('.cache/market_data')
+except ImportError:
+    logger.warning("diskcache not installed, market data will not be cached. Run: pip install diskcache")
+    _MD_CACHE = None
+
+HISTORY_PERIOD = "2mo"  # ~40 trading days, enough bars for a full 20-day MA
+MA_WINDOW = 20
+CACHE_TTL = 60  # seconds, keeps intraday data fresh
+
+def _cache_get(ticker):
+    if _MD_CACHE is None:
+        return None
+    return _MD_CACHE.get((ticker, HISTORY_PERIOD))
+
+def _cache_set(ticker, result):
+    # Only successful lookups are cached so failures are retried on the next call
+    if _MD_CACHE is not None and result:
+        _MD_CACHE.set((ticker, HISTORY_PERIOD), result, expire=CACHE_TTL)
+
+def _summarize(data):
+    """
+    Reduce a price history frame to the latest price/volume, MA20 and average volume.
+    MA20 is NaN when the history has fewer than MA_WINDOW bars.
+    """
+    closes = data['Close'].to_numpy(dtype='float64')
+    volumes = data['Volume'].to_numpy(dtype='float64')
+
+    return {
+        "price": float(closes[-1]),
+        "volume": float(volumes[-1]),
+        "ma20": float(rolling_mean_last(closes, MA_WINDOW)),
+        "avg_volume": float(mean(volumes))
+    }
+
 def get_market_data(ticker):
     """
     Fetch recent market data for the given ticker using yfinance.
     Returns a dictionary with price, volume, MA20, and average volume.
+    Results are cached on disk for CACHE_TTL seconds.
     """
+    ticker = ticker.upper().strip()
+
+    cached = _cache_get(ticker)
+    if cached is not None:
+        return cached
+
     try:
-        data = yf.Ticker(ticker).history(period="5d")
-        if data.empty:
+        data = yf.Ticker(ticker).history(period=HISTORY_PERIOD, auto_adjust=True)
+        if len(data) == 0:
             logger.warning(f"No data found for ticker: {ticker}")
             return {}
 
-        latest = data.iloc[-1]
-        ma20 = data['Close'].rolling(window=20).mean().iloc[-1]
-
-        return {
-            "price": latest['Close'],
-            "volume": latest['Volume'],
-            "ma20": ma20,
-            "avg_volume": data['Volume'].mean()
-        }
+        result = _summarize(data)
 
     except Exception as e:
         logger.error(f"Error fetching market data for {ticker}: {e}")
         return {}
+
+    _cache_set(ticker, result)
+    return result
+
+def get_market_data_batch(tickers):
+    """
+    Fetch market data for several tickers, downloading all uncached tickers
+    in a single yfinance request.
+    Returns a dictionary mapping each unique ticker to its market data.
+    """
+    unique_tickers = list(dict.fromkeys(tickers))
+    normalized = {ticker: ticker.upper().strip() for ticker in unique_tickers}
+
+    symbols = list(dict.fromkeys(normalized.values()))
+
+    results = {}
+    for symbol in symbols:
+        cached = _cache_get(symbol)
+        if cached is not None:
+            results[symbol] = cached
+
+    missing = [symbol for symbol in symbols if symbol not in results]
+    if len(missing) == 1:
+        results[missing[0]] = get_market_data(missing[0])
+    elif missing:
+        results.update(_download_batch(missing))
+
+    return {ticker: results[symbol] for ticker, symbol in normalized.items()}
+
+def _download_batch(symbols):
+    """Download history for several symbols in one request and summarize each."""
+    try:
+        # auto_adjust must match get_market_data since both paths share cache keys
+        data = yf.download(
+            ' '.join(symbols), period=HISTORY_PERIOD, group_by='ticker',
+            auto_adjust=True, threads=True, progress=False
+        )
+    except Exception as e:
+        logger.error(f"Error fetching market data for {', '.join(symbols)}: {e}")
+        return {symbol: {} for symbol in symbols}
+
+    results = {}
+    for symbol in symbols:
+        try:
+            history = data[symbol].dropna(how='all')
+            if len(history) == 0:
+                logger.warning(f"No data found for ticker: {symbol}")
+                results[symbol] = {}
+                continue
+
+            results[symbol] = _summarize(history)
+            _cache_set(symbol, results[symbol])
+
+        except Exception as e:
+            logger.error(f"Error fetching market data for {symbol}: {e}")
+            results[symbol] = {}
+
+    return results